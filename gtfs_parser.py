@@ -1,152 +1,465 @@
 import argparse
+import csv
+import logging
+import mmap
+import multiprocessing
 import os
+import threading
+import warnings
+
+# Prefer the native (upb) protobuf backend; it must be selected before
+# the generated bindings are imported. ParseFromString and field access are
+# orders of magnitude slower on the pure-Python fallback.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+import numpy as np
+import orjson
 import pandas as pd
+from google.protobuf.internal import api_implementation
 from google.protobuf.json_format import MessageToDict
 from google.transit import gtfs_realtime_pb2
 
-def parse_gtfs_realtime(pb_file_path, output_format='csv', output_file=None):
+logger = logging.getLogger(__name__)
+
+if api_implementation.Type() == "python":
+    warnings.warn(
+        "google.protobuf is using the pure-Python backend; parsing large "
+        "feeds will be slow. Install a protobuf build with the C++/upb "
+        "extension (protobuf>=4 binary wheels include it).")
+
+# Enum value -> name maps, inverted once at import; Enum.Name() walks the
+# descriptor's value list on every call.
+_SCHED_REL_NAMES = {
+    v: k for k, v in gtfs_realtime_pb2.TripDescriptor.ScheduleRelationship.items()}
+_VEH_STATUS_NAMES = {
+    v: k for k, v in gtfs_realtime_pb2.VehiclePosition.VehicleStopStatus.items()}
+_CAUSE_NAMES = {v: k for k, v in gtfs_realtime_pb2.Alert.Cause.items()}
+_EFFECT_NAMES = {v: k for k, v in gtfs_realtime_pb2.Alert.Effect.items()}
+
+# Bound .get methods so the processors skip the attribute lookup per entity
+_sched_rel_name = _SCHED_REL_NAMES.get
+_veh_status_name = _VEH_STATUS_NAMES.get
+_cause_name = _CAUSE_NAMES.get
+_effect_name = _EFFECT_NAMES.get
+
+# Output schema per entity type; each processor fills one list per column
+TRIP_UPDATE_COLUMNS = ("Entity ID", "Type", "Trip ID", "Route ID",
+                       "Schedule Relationship", "Stop Updates", "Timestamp")
+VEHICLE_COLUMNS = ("Entity ID", "Type", "Trip ID", "Route ID", "Vehicle ID",
+                   "Vehicle Label", "Latitude", "Longitude", "Bearing",
+                   "Speed", "Current Stop", "Current Status", "Timestamp")
+ALERT_COLUMNS = ("Entity ID", "Type", "Active Periods", "Informed Entities",
+                 "Cause", "Effect", "Header Text", "Description Text")
+
+def _new_columns():
+    """Fresh, empty column lists for each entity type."""
+    return ({name: [] for name in TRIP_UPDATE_COLUMNS},
+            {name: [] for name in VEHICLE_COLUMNS},
+            {name: [] for name in ALERT_COLUMNS})
+
+def _process_entities(entities, tu_cols, vp_cols, alert_cols):
+    """Run every entity through its processor, filling the column lists."""
+    # Map the FeedEntity payload field name to its processor and columns
+    handlers = {
+        "trip_update": (process_trip_update, tu_cols),
+        "vehicle": (process_vehicle_position, vp_cols),
+        "alert": (process_alert, alert_cols),
+    }
+
+    # Hoist the method lookup out of the loop (one LOAD_ATTR per feed,
+    # not per entity)
+    get_handler = handlers.get
+
+    for entity in entities:
+        # FeedEntity does not declare its payload fields as a oneof, so a
+        # single ListFields() pass replaces the chain of HasField() calls.
+        for field, _ in entity.ListFields():
+            handler = get_handler(field.name)
+            if handler is not None:
+                handler[0](entity, handler[1])
+                break
+
+def _process_shard(serialized_entities):
+    """Pool worker: re-parse serialized FeedEntity bytes and process them."""
+    tu_cols, vp_cols, alert_cols = _new_columns()
+    from_string = gtfs_realtime_pb2.FeedEntity.FromString
+    _process_entities(map(from_string, serialized_entities),
+                      tu_cols, vp_cols, alert_cols)
+    return tu_cols, vp_cols, alert_cols
+
+def _process_entities_parallel(entities, workers, tu_cols, vp_cols, alert_cols):
+    """Shard the entities over a process pool and merge the column lists.
+
+    Protobuf messages do not pickle cheaply, so each shard travels to its
+    worker as serialized entity bytes and is re-parsed there. Entity
+    processing is independent per entity, so the shards need no
+    coordination; order is restored by the Entity ID sort downstream.
+    """
+    serialized = [entity.SerializeToString() for entity in entities]
+    shard_size = -(-len(serialized) // workers)
+    shards = [serialized[i:i + shard_size]
+              for i in range(0, len(serialized), shard_size)]
+
+    with multiprocessing.Pool(workers) as pool:
+        for shard_tu, shard_vp, shard_alert in pool.imap_unordered(_process_shard, shards):
+            for cols, shard in ((tu_cols, shard_tu), (vp_cols, shard_vp),
+                                (alert_cols, shard_alert)):
+                for name, values in shard.items():
+                    cols[name].extend(values)
+
+# Reused per thread across invocations; re-parsing into a cleared message
+# recycles its internal buffers instead of rebuilding the object tree
+_local = threading.local()
+
+def _get_feed():
+    """Thread-local FeedMessage, created on first use."""
+    feed = getattr(_local, "feed", None)
+    if feed is None:
+        feed = _local.feed = gtfs_realtime_pb2.FeedMessage()
+    return feed
+
+def _read_feed(pb_file_path, verbose=False):
+    """Read and parse a .pb file into a FeedMessage.
+
+    The returned message is a thread-local instance reused across calls;
+    a later call from the same thread overwrites it.
+    """
+    if not os.path.exists(pb_file_path):
+        raise FileNotFoundError(f"File not found: {pb_file_path}")
+
+    # Parse the GTFS-realtime protobuf file. Memory-mapping lets the parser
+    # read straight from the page cache instead of allocating a full bytes
+    # copy of the file first; the memoryview wrapper is required because the
+    # native backend accepts buffers but not mmap objects directly.
+    feed = _get_feed()
+    feed.Clear()
+    with open(pb_file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap rejects empty files; an empty buffer is a valid empty feed
+            feed.MergeFromString(b"")
+        else:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # Release the view before closing; mmap refuses to close
+                # while a buffer export is alive
+                with memoryview(mm) as view:
+                    feed.MergeFromString(view)
+            finally:
+                mm.close()
+
+    # Log basic feed info; skipped entirely on hot paths unless requested
+    if verbose:
+        logger.info("GTFS Realtime Feed Version: %s",
+                    feed.header.gtfs_realtime_version)
+        if feed.header.HasField("timestamp"):
+            from datetime import datetime
+            logger.info("Feed Timestamp: %s",
+                        datetime.fromtimestamp(feed.header.timestamp))
+        logger.info("Number of entities: %d", len(feed.entity))
+
+    return feed
+
+def _parse_tables(pb_file_path, workers=1, verbose=False):
+    """Parse the feed and return the per-type column tables."""
+    feed = _read_feed(pb_file_path, verbose=verbose)
+
+    # Accumulate one list per column per entity type (struct-of-arrays)
+    tu_cols, vp_cols, alert_cols = _new_columns()
+
+    if workers > 1 and len(feed.entity) > 1:
+        _process_entities_parallel(feed.entity, workers,
+                                   tu_cols, vp_cols, alert_cols)
+    else:
+        _process_entities(feed.entity, tu_cols, vp_cols, alert_cols)
+
+    return tu_cols, vp_cols, alert_cols
+
+def _union_columns(tables):
+    """Union of the tables' column names, keeping first-seen order."""
+    fieldnames = []
+    for cols in tables:
+        for name in cols:
+            if name not in fieldnames:
+                fieldnames.append(name)
+    return fieldnames
+
+# Vehicle columns stored as float32 arrays in the DataFrame output
+_VP_FLOAT_COLUMNS = ("Latitude", "Longitude", "Bearing", "Speed")
+
+def _float_column(values):
+    """A vehicle numeric column as float32, with NaN for missing values."""
+    return np.array([v if v != "" else np.nan for v in values],
+                    dtype=np.float32)
+
+def clean_vehicle_positions(df):
+    """Vectorized cleanup of the vehicle numeric columns in place.
+
+    Masks out-of-range coordinates to NaN and normalizes Bearing into
+    [0, 360). Operates on the contiguous float32 columns produced by
+    parse_to_dataframe, so the whole pass runs in numpy.
+    """
+    lat = df["Latitude"].to_numpy()
+    lon = df["Longitude"].to_numpy()
+    invalid = (np.abs(lat) > 90) | (np.abs(lon) > 180)
+    df.loc[invalid, ["Latitude", "Longitude"]] = np.nan
+    df["Bearing"] = np.mod(df["Bearing"].to_numpy(), 360)
+    return df
+
+def _union_dtype(fieldnames, ids_numeric):
+    """Structured dtype for the union schema across the entity types."""
+    fields = []
+    for name in fieldnames:
+        if name in _VP_FLOAT_COLUMNS:
+            fields.append((name, "f4"))
+        elif name == "Entity ID" and ids_numeric:
+            fields.append((name, "i8"))
+        elif name == "Type":
+            fields.append((name, "U16"))
+        else:
+            fields.append((name, "O"))
+    return np.dtype(fields)
+
+def _numeric_ids(ids):
+    """Entity IDs as an int64 array when all of them are numeric, else None."""
+    try:
+        return np.fromiter((int(x) for x in ids), dtype=np.int64, count=len(ids))
+    except (ValueError, OverflowError):
+        return None
+
+def _sort_order(tables):
+    """Row permutation that sorts the stacked tables by Entity ID.
+
+    All-numeric ids sort through a C-level argsort on int64; otherwise one
+    TimSort over the compact id list, rather than comparing rows (or
+    pandas object columns) directly.
+    """
+    ids = []
+    for cols in tables:
+        ids.extend(cols["Entity ID"])
+    numeric = _numeric_ids(ids)
+    if numeric is not None:
+        return np.argsort(numeric, kind="stable")
+    return sorted(range(len(ids)), key=ids.__getitem__)
+
+def _iter_rows(tables):
+    """One dict per row across the non-empty tables, in Entity ID order."""
+    rows = []
+    for cols in tables:
+        if cols["Entity ID"]:
+            names = list(cols)
+            rows.extend(dict(zip(names, values)) for values in zip(*cols.values()))
+    order = _sort_order([cols for cols in tables if cols["Entity ID"]])
+    return [rows[i] for i in order]
+
+def write_csv(tables, output_file):
+    """Stream the parsed tables to CSV without building a DataFrame."""
+    tables = [cols for cols in tables if cols["Entity ID"]]
+    fieldnames = _union_columns(tables)
+    with open(output_file, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, restval="")
+        writer.writeheader()
+        writer.writerows(_iter_rows(tables))
+
+def write_json(tables, output_file):
+    """Write the parsed tables to JSON without building a DataFrame."""
+    with open(output_file, "wb") as f:
+        f.write(orjson.dumps(_iter_rows(tables), option=orjson.OPT_INDENT_2))
+
+def parse_gtfs_realtime(pb_file_path, output_format='csv', output_file=None,
+                        workers=1, verbose=False):
     """
     Parse a GTFS Realtime protocol buffer file and output the data in CSV or JSON format.
-    
+
+    Rows are streamed straight from the parsed column tables to the
+    writers; no DataFrame is materialized. Use parse_to_dataframe() for
+    interactive/pandas use.
+
     Args:
         pb_file_path (str): Path to the GTFS Realtime .pb file
         output_format (str): Output format ('csv' or 'json')
         output_file (str): Path to the output file (optional)
-    
+        workers (int): Number of worker processes for entity processing
+        verbose (bool): Log feed info and progress via the logging module
+    """
+    tables = _parse_tables(pb_file_path, workers, verbose=verbose)
+
+    if not any(cols["Entity ID"] for cols in tables):
+        logger.warning("No entities were processed.")
+        return
+
+    if output_file:
+        if output_format.lower() == 'csv':
+            write_csv(tables, output_file)
+            if verbose:
+                logger.info("CSV file created at: %s", output_file)
+        elif output_format.lower() == 'json':
+            write_json(tables, output_file)
+            if verbose:
+                logger.info("JSON file created at: %s", output_file)
+
+def parse_to_dataframe(pb_file_path, workers=1, verbose=False):
+    """
+    Parse a GTFS Realtime protocol buffer file into a pandas DataFrame.
+
+    Args:
+        pb_file_path (str): Path to the GTFS Realtime .pb file
+        workers (int): Number of worker processes for entity processing
+        verbose (bool): Log feed info via the logging module
+
     Returns:
         DataFrame: Pandas DataFrame containing the parsed data
     """
-    if not os.path.exists(pb_file_path):
-        raise FileNotFoundError(f"File not found: {pb_file_path}")
-    
-    # Parse the GTFS-realtime protobuf file
-    feed = gtfs_realtime_pb2.FeedMessage()
-    with open(pb_file_path, "rb") as f:
-        feed.ParseFromString(f.read())
-    
-    # Print basic feed info
-    print(f"GTFS Realtime Feed Version: {feed.header.version}")
-    if feed.header.HasField("timestamp"):
-        from datetime import datetime
-        print(f"Feed Timestamp: {datetime.fromtimestamp(feed.header.timestamp)}")
-    
-    print(f"Number of entities: {len(feed.entity)}")
-    
-    # Prepare a list to store each entity's data
-    data = []
-    for entity in feed.entity:
-        entity_id = entity.id
-        
-        # Check what type of entity we have
-        if entity.HasField("trip_update"):
-            # This is a trip update entity
-            trip_update_data = process_trip_update(entity)
-            if trip_update_data:
-                data.append(trip_update_data)
-        
-        elif entity.HasField("vehicle"):
-            # This is a vehicle position entity
-            vehicle_data = process_vehicle_position(entity)
-            if vehicle_data:
-                data.append(vehicle_data)
-        
-        elif entity.HasField("alert"):
-            # This is an alert entity - using your specific processing
-            alert_data = process_alert(entity)
-            if alert_data:
-                data.append(alert_data)
-    
-    # Create a pandas DataFrame
-    if data:
-        df = pd.DataFrame(data)
-        
-        # Sort by Entity ID
-        if "Entity ID" in df.columns:
-            df.sort_values("Entity ID", inplace=True)
-        
-        # Export the data if requested
-        if output_file:
-            if output_format.lower() == 'csv':
-                df.to_csv(output_file, index=False, encoding="utf-8-sig")
-                print(f"CSV file created at: {output_file}")
-            elif output_format.lower() == 'json':
-                df.to_json(output_file, orient="records", force_ascii=False, indent=2)
-                print(f"JSON file created at: {output_file}")
-        
-        return df
-    else:
-        print("No entities were processed.")
+    tables = _parse_tables(pb_file_path, workers, verbose=verbose)
+
+    tables = [cols for cols in tables if cols["Entity ID"]]
+    if not tables:
+        logger.warning("No entities were processed.")
         return pd.DataFrame()
 
-def process_trip_update(entity):
-    """Process a trip update entity."""
+    # Vehicle numeric columns become contiguous float32 arrays (NaN for
+    # missing) so downstream numeric passes vectorize instead of walking
+    # per-cell Python objects
+    for cols in tables:
+        if "Latitude" in cols:
+            for name in _VP_FLOAT_COLUMNS:
+                cols[name] = _float_column(cols[name])
+
+    # Store all-numeric Entity IDs as int64 so sorting, joins and IO stay
+    # out of object dtype (all-or-nothing, to keep the dtype uniform)
+    converted = [_numeric_ids(cols["Entity ID"]) for cols in tables]
+    ids_numeric = all(ids is not None for ids in converted)
+    if ids_numeric:
+        for cols, ids in zip(tables, converted):
+            cols["Entity ID"] = ids
+
+    # Preallocate one record array over the union schema and fill it
+    # column-wise: a single contiguous allocation with no per-row dict
+    # work and no NaN-reconciliation pass inside pandas
+    fieldnames = _union_columns(tables)
+    arr = np.empty(sum(len(cols["Entity ID"]) for cols in tables),
+                   dtype=_union_dtype(fieldnames, ids_numeric))
+    start = 0
+    for cols in tables:
+        stop = start + len(cols["Entity ID"])
+        for name in fieldnames:
+            if name in cols:
+                arr[name][start:stop] = cols[name]
+            else:
+                arr[name][start:stop] = (np.nan if name in _VP_FLOAT_COLUMNS
+                                         else "")
+        start = stop
+
+    # Sort by Entity ID via a precomputed permutation; sort_values on an
+    # object column would compare cells through pandas' machinery
+    arr = arr[_sort_order(tables)]
+
+    return pd.DataFrame.from_records(arr)
+
+def parse_to_raw_dataframe(pb_file_path, verbose=False):
+    """
+    Parse a GTFS Realtime protocol buffer file into a DataFrame of the raw
+    feed schema (proto field names, one column per flattened field).
+
+    MessageToDict traverses the whole message inside the protobuf native
+    layer and json_normalize flattens the result in one pass, which is far
+    cheaper than per-field Python access. Use this when the raw schema is
+    acceptable; parse_to_dataframe() produces the curated columns (joined
+    stop updates, Hebrew alert text, enum names).
+
+    Args:
+        pb_file_path (str): Path to the GTFS Realtime .pb file
+
+    Returns:
+        DataFrame: Pandas DataFrame with the flattened feed entities
+    """
+    feed = _read_feed(pb_file_path, verbose=verbose)
+    d = MessageToDict(feed, preserving_proto_field_name=True,
+                      use_integers_for_enums=True)
+    return pd.json_normalize(d.get("entity", []))
+
+def _fmt_stop(stop_update):
+    """Format one stop time update as "stop_id:arrival-departure"."""
+    arrival = stop_update.arrival.time if stop_update.HasField("arrival") else ""
+    departure = stop_update.departure.time if stop_update.HasField("departure") else ""
+    return stop_update.stop_id + ":" + str(arrival) + "-" + str(departure)
+
+def process_trip_update(entity, cols):
+    """Process a trip update entity into the trip update columns."""
     trip_update = entity.trip_update
-    
-    # Basic trip info
-    trip_id = trip_update.trip.trip_id if trip_update.trip.HasField("trip_id") else ""
-    route_id = trip_update.trip.route_id if trip_update.trip.HasField("route_id") else ""
-    
-    # Get schedule relationship
-    schedule_relationship = gtfs_realtime_pb2.TripDescriptor.ScheduleRelationship.Name(
-        trip_update.trip.schedule_relationship) if trip_update.trip.HasField("schedule_relationship") else "SCHEDULED"
-    
+    trip = trip_update.trip
+
+    # Basic trip info (unset scalar strings are already "")
+    trip_id = trip.trip_id
+    route_id = trip.route_id
+
+    # Get schedule relationship (the enum default is SCHEDULED)
+    schedule_relationship = _sched_rel_name(trip.schedule_relationship, "")
+
     # Process stop time updates
-    stop_updates = []
-    for stop_update in trip_update.stop_time_update:
-        stop_id = stop_update.stop_id if stop_update.HasField("stop_id") else ""
-        arrival_time = stop_update.arrival.time if stop_update.HasField("arrival") and stop_update.arrival.HasField("time") else ""
-        departure_time = stop_update.departure.time if stop_update.HasField("departure") and stop_update.departure.HasField("time") else ""
-        
-        stop_updates.append(f"{stop_id}:{arrival_time}-{departure_time}")
-    
-    return {
-        "Entity ID": entity.id,
-        "Type": "trip_update",
-        "Trip ID": trip_id,
-        "Route ID": route_id,
-        "Schedule Relationship": schedule_relationship,
-        "Stop Updates": "; ".join(stop_updates),
-        "Timestamp": trip_update.timestamp if trip_update.HasField("timestamp") else ""
-    }
+    stop_updates = "; ".join(map(_fmt_stop, trip_update.stop_time_update))
+
+    cols["Entity ID"].append(entity.id)
+    cols["Type"].append("trip_update")
+    cols["Trip ID"].append(trip_id)
+    cols["Route ID"].append(route_id)
+    cols["Schedule Relationship"].append(schedule_relationship)
+    cols["Stop Updates"].append(stop_updates)
+    cols["Timestamp"].append(
+        trip_update.timestamp if trip_update.HasField("timestamp") else "")
 
-def process_vehicle_position(entity):
-    """Process a vehicle position entity."""
+def process_vehicle_position(entity, cols):
+    """Process a vehicle position entity into the vehicle columns."""
     vehicle = entity.vehicle
-    
-    # Basic trip and vehicle info
-    trip_id = vehicle.trip.trip_id if vehicle.HasField("trip") and vehicle.trip.HasField("trip_id") else ""
-    route_id = vehicle.trip.route_id if vehicle.HasField("trip") and vehicle.trip.HasField("route_id") else ""
-    vehicle_id = vehicle.vehicle.id if vehicle.HasField("vehicle") and vehicle.vehicle.HasField("id") else ""
-    vehicle_label = vehicle.vehicle.label if vehicle.HasField("vehicle") and vehicle.vehicle.HasField("label") else ""
-    
-    # Position info
-    latitude = vehicle.position.latitude if vehicle.HasField("position") else ""
-    longitude = vehicle.position.longitude if vehicle.HasField("position") else ""
-    bearing = vehicle.position.bearing if vehicle.HasField("position") and vehicle.position.HasField("bearing") else ""
-    speed = vehicle.position.speed if vehicle.HasField("position") and vehicle.position.HasField("speed") else ""
-    
+    trip = vehicle.trip
+    descriptor = vehicle.vehicle
+
+    # Basic trip and vehicle info (unset scalar strings are already "")
+    trip_id = trip.trip_id
+    route_id = trip.route_id
+    vehicle_id = descriptor.id
+    vehicle_label = descriptor.label
+
+    # Position info; presence checks stay only where unset differs from a
+    # legitimate zero (bearing/speed)
+    pos = vehicle.position
+    has_pos = vehicle.HasField("position")
+    latitude = pos.latitude if has_pos else ""
+    longitude = pos.longitude if has_pos else ""
+    bearing = pos.bearing if has_pos and pos.HasField("bearing") else ""
+    speed = pos.speed if has_pos and pos.HasField("speed") else ""
+
     # Current stop info
-    current_stop = vehicle.stop_id if vehicle.HasField("stop_id") else ""
-    current_status = gtfs_realtime_pb2.VehiclePosition.VehicleStopStatus.Name(
-        vehicle.current_status) if vehicle.HasField("current_status") else ""
-    
-    return {
-        "Entity ID": entity.id,
-        "Type": "vehicle_position",
-        "Trip ID": trip_id,
-        "Route ID": route_id,
-        "Vehicle ID": vehicle_id,
-        "Vehicle Label": vehicle_label,
-        "Latitude": latitude,
-        "Longitude": longitude,
-        "Bearing": bearing,
-        "Speed": speed,
-        "Current Stop": current_stop,
-        "Current Status": current_status,
-        "Timestamp": vehicle.timestamp if vehicle.HasField("timestamp") else ""
-    }
+    current_stop = vehicle.stop_id
+    current_status = (_veh_status_name(vehicle.current_status, "")
+                      if vehicle.HasField("current_status") else "")
+
+    cols["Entity ID"].append(entity.id)
+    cols["Type"].append("vehicle_position")
+    cols["Trip ID"].append(trip_id)
+    cols["Route ID"].append(route_id)
+    cols["Vehicle ID"].append(vehicle_id)
+    cols["Vehicle Label"].append(vehicle_label)
+    cols["Latitude"].append(latitude)
+    cols["Longitude"].append(longitude)
+    cols["Bearing"].append(bearing)
+    cols["Speed"].append(speed)
+    cols["Current Stop"].append(current_stop)
+    cols["Current Status"].append(current_status)
+    cols["Timestamp"].append(
+        vehicle.timestamp if vehicle.HasField("timestamp") else "")
+
+# EntitySelector fields surfaced in the "Informed Entities" column
+_IE_FIELDS = ("route_id", "stop_id", "agency_id")
+
+def _pick_translation(translations, lang="he"):
+    """Return the text for lang from a TranslatedString's translations,
+    falling back to the first translation when lang is absent."""
+    for trans in translations:
+        if trans.language == lang and trans.text:
+            return trans.text
+    return translations[0].text if translations else ""
 
-def process_alert(entity):
+def process_alert(entity, cols):
     """Process an alert entity - following the specific logic from your code."""
     alert = entity.alert
     
@@ -154,69 +467,51 @@ def process_alert(entity):
     active_periods = "; ".join(f"{ap.start}-{ap.end}" for ap in alert.active_period) if alert.active_period else ""
     
     # Combine informed entities (listing available fields for each)
-    informed = []
-    for ie in alert.informed_entity:
-        parts = []
-        if ie.HasField("route_id"):
-            parts.append(f"route_id={ie.route_id}")
-        if ie.HasField("stop_id"):
-            parts.append(f"stop_id={ie.stop_id}")
-        if ie.HasField("agency_id"):
-            parts.append(f"agency_id={ie.agency_id}")
-        informed.append(" | ".join(parts))
-    informed_entities = "; ".join(informed)
+    informed_entities = "; ".join(
+        " | ".join(f"{name}={getattr(ie, name)}" for name in _IE_FIELDS
+                   if ie.HasField(name))
+        for ie in alert.informed_entity)
     
-    # Get cause and effect names (from enum values)
-    cause = gtfs_realtime_pb2.Alert.Cause.Name(alert.cause)
-    effect = gtfs_realtime_pb2.Alert.Effect.Name(alert.effect)
+    # Get cause and effect names (from the precomputed enum maps)
+    cause = _cause_name(alert.cause, "")
+    effect = _effect_name(alert.effect, "")
     
-    # Select header_text in language "he" (if available)
-    header_text = ""
-    for trans in alert.header_text.translation:
-        if trans.language == "he" and trans.text:
-            header_text = trans.text
-            break
-    # If no Hebrew text found, use the first available translation
-    if not header_text and alert.header_text.translation:
-        header_text = alert.header_text.translation[0].text
-    
-    # Select description_text in language "he" (if available)
-    description_text = ""
-    for trans in alert.description_text.translation:
-        if trans.language == "he" and trans.text:
-            description_text = trans.text
-            break
-    # If no Hebrew text found, use the first available translation
-    if not description_text and alert.description_text.translation:
-        description_text = alert.description_text.translation[0].text
-    
-    # Return the collected data as a dictionary
-    return {
-        "Entity ID": entity.id,
-        "Type": "alert",
-        "Active Periods": active_periods,
-        "Informed Entities": informed_entities,
-        "Cause": cause,
-        "Effect": effect,
-        "Header Text": header_text,
-        "Description Text": description_text
-    }
+    # Select header/description text in language "he" (if available),
+    # falling back to the first translation
+    header_text = _pick_translation(alert.header_text.translation)
+    description_text = _pick_translation(alert.description_text.translation)
+
+
+    # Append the collected data to the alert columns
+    cols["Entity ID"].append(entity.id)
+    cols["Type"].append("alert")
+    cols["Active Periods"].append(active_periods)
+    cols["Informed Entities"].append(informed_entities)
+    cols["Cause"].append(cause)
+    cols["Effect"].append(effect)
+    cols["Header Text"].append(header_text)
+    cols["Description Text"].append(description_text)
 
 def main():
     parser = argparse.ArgumentParser(description='Parse GTFS Realtime Protocol Buffer files')
     parser.add_argument('pb_file', help='Path to the GTFS Realtime .pb file')
     parser.add_argument('--format', choices=['csv', 'json'], default='csv', help='Output format (default: csv)')
     parser.add_argument('--output', help='Output file path (default: based on input filename)')
-    
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of worker processes for entity processing (default: 1)')
+
     args = parser.parse_args()
-    
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     if not args.output:
         # Generate default output filename based on input
         base_name = os.path.splitext(args.pb_file)[0]
         args.output = f"{base_name}.{args.format}"
     
     # Parse the file and generate output
-    parse_gtfs_realtime(args.pb_file, args.format, args.output)
+    parse_gtfs_realtime(args.pb_file, args.format, args.output,
+                        workers=args.workers, verbose=True)
 
 if __name__ == "__main__":
     main()
@@ -1,145 +1,299 @@
-from flask import Flask, render_template, request, send_file, jsonify
+from flask import Flask, render_template, request, send_file, Response
+import gzip
 import tempfile
+import threading
 import os
-import pandas as pd
+import warnings
+
+# Prefer the native (upb) protobuf backend; it must be selected before
+# the generated bindings are imported, and makes ParseFromString orders of
+# magnitude faster than the pure-Python fallback.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+import orjson
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from pyarrow import feather
+from google.protobuf.internal import api_implementation
 from google.transit import gtfs_realtime_pb2
-import io
-import json
 from datetime import datetime
 
+if api_implementation.Type() == "python":
+    warnings.warn(
+        "google.protobuf is using the pure-Python backend; parsing uploaded "
+        "feeds will be slow. Install a protobuf build with the C++/upb "
+        "extension (protobuf>=4 binary wheels include it).")
+
 app = Flask(__name__)
+# index.html is static; outside debug, skip the template mtime check that
+# render_template would otherwise do on every request
+if os.environ.get('FLASK_DEBUG') != '1':
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
+
+# Enum value -> name maps, inverted once at import; Enum.Name() walks the
+# descriptor's value list on every call.
+_SCHED_REL_NAMES = {
+    v: k for k, v in gtfs_realtime_pb2.TripDescriptor.ScheduleRelationship.items()}
+_VEH_STATUS_NAMES = {
+    v: k for k, v in gtfs_realtime_pb2.VehiclePosition.VehicleStopStatus.items()}
+_CAUSE_NAMES = {v: k for k, v in gtfs_realtime_pb2.Alert.Cause.items()}
+_EFFECT_NAMES = {v: k for k, v in gtfs_realtime_pb2.Alert.Effect.items()}
+
+# Output schema per entity type; each processor fills one list per column
+ALERT_COLUMNS = ("Entity ID", "Active Periods", "Informed Entities", "Cause",
+                 "Effect", "Header Text", "Description Text")
+TRIP_UPDATE_COLUMNS = ("Entity ID", "Trip ID", "Route ID",
+                       "Schedule Relationship", "Stop Updates", "Timestamp")
+VEHICLE_COLUMNS = ("Entity ID", "Trip ID", "Route ID", "Vehicle ID",
+                   "Vehicle Label", "Latitude", "Longitude", "Bearing",
+                   "Speed", "Current Stop", "Current Status", "Timestamp")
+
+def _json_response(payload, status=200):
+    """JSON response serialized by orjson instead of Flask's stdlib-json
+    jsonify."""
+    return Response(orjson.dumps(payload), status=status,
+                    mimetype='application/json')
 
 @app.route('/')
 def index():
     return render_template('index.html')
 
+# Non-string output columns; the processors emit "" for missing values,
+# which becomes null in the typed Arrow columns
+_FLOAT_COLUMNS = frozenset(("Latitude", "Longitude", "Bearing", "Speed"))
+_INT_COLUMNS = frozenset(("Timestamp",))
+
+def _column_type(name):
+    if name in _FLOAT_COLUMNS:
+        return pa.float64()
+    if name in _INT_COLUMNS:
+        return pa.int64()
+    return pa.string()
+
+def _tables_to_arrow(col_tables):
+    """Stack the per-type column tables into one Arrow table over the
+    union schema, sorted by Entity ID, with nulls for columns an entity
+    type does not produce."""
+    col_tables = [cols for cols in col_tables if cols["Entity ID"]]
+    fieldnames = []
+    for cols in col_tables or (dict.fromkeys(ALERT_COLUMNS),
+                               dict.fromkeys(TRIP_UPDATE_COLUMNS),
+                               dict.fromkeys(VEHICLE_COLUMNS)):
+        for name in cols:
+            if name not in fieldnames:
+                fieldnames.append(name)
+
+    # Merge into union-schema Python lists (None where a type lacks the
+    # column or a numeric value is missing)
+    merged = {name: [] for name in fieldnames}
+    for cols in col_tables:
+        n = len(cols["Entity ID"])
+        for name in fieldnames:
+            values = cols.get(name)
+            if values is None:
+                merged[name].extend([None] * n)
+            elif name in _FLOAT_COLUMNS or name in _INT_COLUMNS:
+                merged[name].extend(v if v != "" else None for v in values)
+            else:
+                merged[name].extend(values)
+
+    # One TimSort over the compact id list, applied as a permutation to
+    # each column while it is still a plain list; cheaper than a generic
+    # table-level sort over the mixed columns
+    ids = merged["Entity ID"]
+    order = sorted(range(len(ids)), key=ids.__getitem__)
+    return pa.table({name: pa.array([col[i] for i in order],
+                                    type=_column_type(name))
+                     for name, col in merged.items()})
+
+# One FeedMessage per worker thread, recycled across uploads; protobuf
+# reuses the contained message objects on MergeFromString after a Clear()
+_tls = threading.local()
+
+def _get_feed():
+    feed = getattr(_tls, "feed", None)
+    if feed is None:
+        feed = _tls.feed = gtfs_realtime_pb2.FeedMessage()
+    return feed
+
+def _parse_feed_columns(buf):
+    """Parse serialized FeedMessage bytes into per-type column dicts.
+
+    This is the CPU-bound core of /upload, kept behind a single function
+    boundary so a native columnar parser could replace it wholesale.
+    Returns the feed plus the alert/trip-update/vehicle column tables and
+    the per-type entity counts.
+    """
+    feed = _get_feed()
+    feed.Clear()
+    feed.MergeFromString(buf)
+
+    # One list per column per entity type (struct-of-arrays), wrapped
+    # into typed Arrow columns after the loop
+    alert_cols = {name: [] for name in ALERT_COLUMNS}
+    tu_cols = {name: [] for name in TRIP_UPDATE_COLUMNS}
+    vp_cols = {name: [] for name in VEHICLE_COLUMNS}
+
+    # Map the FeedEntity payload field name to its processor and columns
+    dispatch = {
+        "alert": (process_alert, alert_cols),
+        "trip_update": (process_trip_update, tu_cols),
+        "vehicle": (process_vehicle_position, vp_cols),
+    }
+    # Count entity types as they are processed instead of re-scanning an
+    # entity list afterwards
+    counts = {"alert": 0, "trip_update": 0, "vehicle": 0}
+    get_handler = dispatch.get
+
+    for entity in feed.entity:
+        # FeedEntity does not declare its payload fields as a oneof, so
+        # WhichOneof is unavailable; one ListFields() pass replaces the
+        # chain of HasField() calls
+        for field, _ in entity.ListFields():
+            handler = get_handler(field.name)
+            if handler is not None:
+                handler[0](entity, handler[1])
+                counts[field.name] += 1
+                break
+
+    return feed, alert_cols, tu_cols, vp_cols, counts
+
 @app.route('/upload', methods=['POST'])
 def upload_file():
     if 'file' not in request.files:
-        return jsonify({"error": "No file part"}), 400
+        return _json_response({"error": "No file part"}, 400)
     
     file = request.files['file']
     
     if file.filename == '':
-        return jsonify({"error": "No selected file"}), 400
+        return _json_response({"error": "No selected file"}, 400)
     
     if not file.filename.endswith('.pb'):
-        return jsonify({"error": "File must be a .pb file"}), 400
+        return _json_response({"error": "File must be a .pb file"}, 400)
     
     try:
-        # Save the uploaded file to a temporary location
         temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, file.filename)
-        file.save(temp_path)
-        
-        # Parse the file
-        feed = gtfs_realtime_pb2.FeedMessage()
-        with open(temp_path, "rb") as f:
-            feed.ParseFromString(f.read())
+
+        # Parse straight from the upload stream; saving to disk and
+        # reading back would cost a full extra write+read of the file
+        feed, alert_cols, tu_cols, vp_cols, counts = _parse_feed_columns(file.read())
         
         # Prepare data for response
         response_data = {
             "feed_info": {
-                "version": feed.header.version,
+                "version": feed.header.gtfs_realtime_version,
                 "timestamp": datetime.fromtimestamp(feed.header.timestamp).isoformat() if feed.header.HasField("timestamp") else None,
                 "entity_count": len(feed.entity)
-            },
-            "entities": []
+            }
         }
         
-        # Process entities
-        data = []
-        for entity in feed.entity:
-            entity_id = entity.id
-            
-            if entity.HasField("alert"):
-                alert_data = process_alert(entity)
-                if alert_data:
-                    data.append(alert_data)
-                    response_data["entities"].append({
-                        "id": entity_id,
-                        "type": "alert",
-                        "data": alert_data
-                    })
-            elif entity.HasField("trip_update"):
-                trip_update_data = process_trip_update(entity)
-                if trip_update_data:
-                    data.append(trip_update_data)
-                    response_data["entities"].append({
-                        "id": entity_id,
-                        "type": "trip_update",
-                        "data": trip_update_data
-                    })
-            elif entity.HasField("vehicle"):
-                vehicle_data = process_vehicle_position(entity)
-                if vehicle_data:
-                    data.append(vehicle_data)
-                    response_data["entities"].append({
-                        "id": entity_id,
-                        "type": "vehicle",
-                        "data": vehicle_data
-                    })
-        
-        # Create a DataFrame
-        df = pd.DataFrame(data)
-        if "Entity ID" in df.columns:
-            df.sort_values("Entity ID", inplace=True)
-        
-        # Save DataFrame to temporary CSV file
-        csv_path = os.path.join(temp_dir, os.path.splitext(file.filename)[0] + ".csv")
-        df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+        # Stack the per-type columns into one sorted Arrow table
+        table = _tables_to_arrow((alert_cols, tu_cols, vp_cols))
         
-        # Save DataFrame to temporary JSON file
-        json_path = os.path.join(temp_dir, os.path.splitext(file.filename)[0] + ".json")
-        df.to_json(json_path, orient="records", force_ascii=False, indent=2)
-        
-        # Clean up temporary upload file
-        os.remove(temp_path)
-        
-        return jsonify({
+        # Persist the parsed table as Feather only; CSV/JSON are
+        # materialized lazily at download time (users rarely fetch both),
+        # so the upload request skips the heavy serialization entirely
+        base = os.path.splitext(file.filename)[0]
+        feather_path = os.path.join(temp_dir, base + ".feather")
+        feather.write_feather(table, feather_path)
+
+        # Drop exports materialized from a previous upload of the same
+        # filename; download_file would otherwise keep serving stale data
+        for stale in (base + ".csv.gz", base + ".json.gz"):
+            try:
+                os.remove(os.path.join(temp_dir, stale))
+            except FileNotFoundError:
+                pass
+
+
+        return _json_response({
             "success": True,
             "message": f"Successfully parsed {len(feed.entity)} entities",
             "feed_info": response_data["feed_info"],
             "csv_ready": True,
             "json_ready": True,
             "entity_counts": {
-                "alerts": sum(1 for e in response_data["entities"] if e["type"] == "alert"),
-                "trip_updates": sum(1 for e in response_data["entities"] if e["type"] == "trip_update"),
-                "vehicle_positions": sum(1 for e in response_data["entities"] if e["type"] == "vehicle")
+                "alerts": counts["alert"],
+                "trip_updates": counts["trip_update"],
+                "vehicle_positions": counts["vehicle"]
             }
         })
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return _json_response({"error": str(e)}, 500)
+
+def _write_csv(table, csv_path):
+    """Write an Arrow table as gzipped CSV, with the BOM kept for Excel."""
+    with pa.CompressedOutputStream(csv_path, "gzip") as out:
+        out.write(b"\xef\xbb\xbf")
+        pacsv.write_csv(table, out)
+
+def _write_json(table, json_path):
+    """Write an Arrow table as gzipped records-oriented JSON via orjson.
+
+    orjson always emits raw UTF-8, so Hebrew text goes out verbatim with
+    no ensure_ascii escaping pass.
+    """
+    # Level 1 costs almost no CPU and still shrinks the feed text severalfold
+    with open(json_path, "wb") as f:
+        f.write(gzip.compress(orjson.dumps(table.to_pylist(),
+                                           option=orjson.OPT_INDENT_2),
+                              compresslevel=1))
 
 @app.route('/download/<format_type>')
 def download_file(format_type):
     filename = request.args.get('filename', '')
     if not filename:
-        return jsonify({"error": "No filename provided"}), 400
+        return _json_response({"error": "No filename provided"}, 400)
     
     temp_dir = tempfile.gettempdir()
     
+    # Exports are stored gzipped and served as-is with
+    # Content-Encoding: gzip; the browser transparently decompresses
     if format_type == 'csv':
-        file_path = os.path.join(temp_dir, filename + ".csv")
+        file_path = os.path.join(temp_dir, filename + ".csv.gz")
         mime_type = 'text/csv'
         download_name = filename + ".csv"
     elif format_type == 'json':
-        file_path = os.path.join(temp_dir, filename + ".json")
+        file_path = os.path.join(temp_dir, filename + ".json.gz")
         mime_type = 'application/json'
         download_name = filename + ".json"
     else:
-        return jsonify({"error": "Invalid format"}), 400
+        return _json_response({"error": "Invalid format"}, 400)
     
+    # Materialize the requested format from the Feather intermediate on
+    # first request; later downloads of the same format reuse the file
     if not os.path.exists(file_path):
-        return jsonify({"error": "File not found"}), 404
+        feather_path = os.path.join(temp_dir, filename + ".feather")
+        if not os.path.exists(feather_path):
+            return _json_response({"error": "File not found"}, 404)
+        table = feather.read_table(feather_path)
+        if format_type == 'csv':
+            _write_csv(table, file_path)
+        else:
+            _write_json(table, file_path)
     
-    return send_file(file_path, 
-                     mimetype=mime_type,
-                     as_attachment=True,
-                     download_name=download_name)
+    # conditional=True enables ETag/If-Modified-Since and range requests,
+    # and lets the WSGI server's file_wrapper use sendfile(2) so repeat
+    # downloads of the same export cost a 304 instead of a full transfer
+    response = send_file(file_path,
+                         mimetype=mime_type,
+                         as_attachment=True,
+                         download_name=download_name,
+                         conditional=True,
+                         etag=True,
+                         last_modified=os.path.getmtime(file_path))
+    response.headers["Content-Encoding"] = "gzip"
+    return response
 
-def process_alert(entity):
-    """Process an alert entity - following the specific logic from your code."""
+def _pick_translation(translations, lang="he"):
+    """Return the text for lang from a TranslatedString's translations,
+    falling back to the first translation when lang is absent."""
+    texts = {t.language: t.text for t in translations if t.text}
+    return texts.get(lang) or (translations[0].text if translations else "")
+
+def process_alert(entity, cols):
+    """Process an alert entity into the alert columns."""
     alert = entity.alert
     
     # Combine active periods into a single string ("start-end")
@@ -158,401 +312,93 @@ def process_alert(entity):
         informed.append(" | ".join(parts))
     informed_entities = "; ".join(informed)
     
-    # Get cause and effect names (from enum values)
-    cause = gtfs_realtime_pb2.Alert.Cause.Name(alert.cause)
-    effect = gtfs_realtime_pb2.Alert.Effect.Name(alert.effect)
-    
-    # Select header_text in language "he" (if available)
-    header_text = ""
-    for trans in alert.header_text.translation:
-        if trans.language == "he" and trans.text:
-            header_text = trans.text
-            break
-    # If no Hebrew text found, use the first available translation
-    if not header_text and alert.header_text.translation:
-        header_text = alert.header_text.translation[0].text
+    # Get cause and effect names (from the precomputed enum maps)
+    cause = _CAUSE_NAMES.get(alert.cause, "")
+    effect = _EFFECT_NAMES.get(alert.effect, "")
     
-    # Select description_text in language "he" (if available)
-    description_text = ""
-    for trans in alert.description_text.translation:
-        if trans.language == "he" and trans.text:
-            description_text = trans.text
-            break
-    # If no Hebrew text found, use the first available translation
-    if not description_text and alert.description_text.translation:
-        description_text = alert.description_text.translation[0].text
+    # Select header/description text in language "he" (if available),
+    # falling back to the first translation
+    header_text = _pick_translation(alert.header_text.translation)
+    description_text = _pick_translation(alert.description_text.translation)
     
-    # Return the collected data as a dictionary
-    return {
-        "Entity ID": entity.id,
-        "Active Periods": active_periods,
-        "Informed Entities": informed_entities,
-        "Cause": cause,
-        "Effect": effect,
-        "Header Text": header_text,
-        "Description Text": description_text
-    }
+    # Append the collected data to the alert columns
+    cols["Entity ID"].append(entity.id)
+    cols["Active Periods"].append(active_periods)
+    cols["Informed Entities"].append(informed_entities)
+    cols["Cause"].append(cause)
+    cols["Effect"].append(effect)
+    cols["Header Text"].append(header_text)
+    cols["Description Text"].append(description_text)
 
-def process_trip_update(entity):
-    """Process a trip update entity."""
+def process_trip_update(entity, cols):
+    """Process a trip update entity into the trip update columns."""
     trip_update = entity.trip_update
-    
-    # Basic trip info
-    trip_id = trip_update.trip.trip_id if trip_update.trip.HasField("trip_id") else ""
-    route_id = trip_update.trip.route_id if trip_update.trip.HasField("route_id") else ""
-    
-    # Get schedule relationship
-    schedule_relationship = gtfs_realtime_pb2.TripDescriptor.ScheduleRelationship.Name(
-        trip_update.trip.schedule_relationship) if trip_update.trip.HasField("schedule_relationship") else "SCHEDULED"
-    
-    # Process stop time updates
-    stop_updates = []
-    for stop_update in trip_update.stop_time_update:
-        stop_id = stop_update.stop_id if stop_update.HasField("stop_id") else ""
-        arrival_time = stop_update.arrival.time if stop_update.HasField("arrival") and stop_update.arrival.HasField("time") else ""
-        departure_time = stop_update.departure.time if stop_update.HasField("departure") and stop_update.departure.HasField("time") else ""
-        
-        stop_updates.append(f"{stop_id}:{arrival_time}-{departure_time}")
-    
-    return {
-        "Entity ID": entity.id,
-        "Trip ID": trip_id,
-        "Route ID": route_id,
-        "Schedule Relationship": schedule_relationship,
-        "Stop Updates": "; ".join(stop_updates),
-        "Timestamp": trip_update.timestamp if trip_update.HasField("timestamp") else ""
-    }
+    trip = trip_update.trip
 
-def process_vehicle_position(entity):
-    """Process a vehicle position entity."""
-    vehicle = entity.vehicle
-    
-    # Basic trip and vehicle info
-    trip_id = vehicle.trip.trip_id if vehicle.HasField("trip") and vehicle.trip.HasField("trip_id") else ""
-    route_id = vehicle.trip.route_id if vehicle.HasField("trip") and vehicle.trip.HasField("route_id") else ""
-    vehicle_id = vehicle.vehicle.id if vehicle.HasField("vehicle") and vehicle.vehicle.HasField("id") else ""
-    vehicle_label = vehicle.vehicle.label if vehicle.HasField("vehicle") and vehicle.vehicle.HasField("label") else ""
-    
-    # Position info
-    latitude = vehicle.position.latitude if vehicle.HasField("position") else ""
-    longitude = vehicle.position.longitude if vehicle.HasField("position") else ""
-    bearing = vehicle.position.bearing if vehicle.HasField("position") and vehicle.position.HasField("bearing") else ""
-    speed = vehicle.position.speed if vehicle.HasField("position") and vehicle.position.HasField("speed") else ""
-    
-    # Current stop info
-    current_stop = vehicle.stop_id if vehicle.HasField("stop_id") else ""
-    current_status = gtfs_realtime_pb2.VehiclePosition.VehicleStopStatus.Name(
-        vehicle.current_status) if vehicle.HasField("current_status") else ""
-    
-    return {
-        "Entity ID": entity.id,
-        "Trip ID": trip_id,
-        "Route ID": route_id,
-        "Vehicle ID": vehicle_id,
-        "Vehicle Label": vehicle_label,
-        "Latitude": latitude,
-        "Longitude": longitude,
-        "Bearing": bearing,
-        "Speed": speed,
-        "Current Stop": current_stop,
-        "Current Status": current_status,
-        "Timestamp": vehicle.timestamp if vehicle.HasField("timestamp") else ""
-    }
+    # Basic trip info (unset scalar strings are already "")
+    trip_id = trip.trip_id
+    route_id = trip.route_id
 
-if __name__ == '__main__':
-    # Create templates directory if it doesn't exist
-    os.makedirs('templates', exist_ok=True)
+    # Get schedule relationship (the enum default is SCHEDULED)
+    schedule_relationship = _SCHED_REL_NAMES.get(trip.schedule_relationship, "")
     
-    # Create index.html template
-    with open('templates/index.html', 'w', encoding='utf-8') as f:
-        f.write('''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>GTFS Realtime Parser</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            color: #333;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        h1, h2, h3 {
-            color: #2c3e50;
-        }
-        .upload-container {
-            margin-bottom: 20px;
-            padding: 20px;
-            border: 2px dashed #ccc;
-            border-radius: 5px;
-            text-align: center;
-        }
-        .upload-container.active {
-            border-color: #3498db;
-        }
-        .button-group {
-            margin: 20px 0;
-        }
-        button {
-            background-color: #3498db;
-            color: white;
-            border: none;
-            padding: 10px 15px;
-            margin-right: 10px;
-            border-radius: 4px;
-            cursor: pointer;
-        }
-        button:hover {
-            background-color: #2980b9;
-        }
-        button:disabled {
-            background-color: #95a5a6;
-            cursor: not-allowed;
-        }
-        .result-container {
-            margin-top: 20px;
-            display: none;
-        }
-        .loading {
-            text-align: center;
-            margin: 20px 0;
-            display: none;
-        }
-        .spinner {
-            border: 4px solid rgba(0, 0, 0, 0.1);
-            border-left-color: #3498db;
-            border-radius: 50%;
-            width: 30px;
-            height: 30px;
-            animation: spin 1s linear infinite;
-            display: inline-block;
-            vertical-align: middle;
-            margin-right: 10px;
-        }
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        .error {
-            color: #e74c3c;
-            padding: 10px;
-            border: 1px solid #e74c3c;
-            border-radius: 4px;
-            margin: 20px 0;
-            display: none;
-        }
-        .info-card {
-            background-color: #f8f9fa;
-            padding: 15px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-        }
-        .success {
-            background-color: #d4edda;
-            color: #155724;
-            padding: 10px;
-            border-radius: 4px;
-            margin-bottom: 20px;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>GTFS Realtime Parser</h1>
-        
-        <div class="info-card">
-            <h3>About This Tool</h3>
-            <p>This tool parses GTFS Realtime Protocol Buffer (.pb) files and extracts the data into CSV and JSON formats.</p>
-            <p>Upload a .pb file to get started.</p>
-        </div>
-        
-        <div class="upload-container" id="drop-area">
-            <p>Drop your GTFS Realtime (.pb) file here</p>
-            <p>or</p>
-            <input type="file" id="fileInput" accept=".pb" style="display: none;">
-            <button id="browseButton">Browse Files</button>
-            <p id="file-name"></p>
-        </div>
-        
-        <div class="button-group">
-            <button id="parseButton" disabled>Parse GTFS Data</button>
-        </div>
-        
-        <div id="loading" class="loading">
-            <div class="spinner"></div>
-            <span>Processing GTFS data...</span>
-        </div>
-        
-        <div id="error-container" class="error"></div>
-        
-        <div id="result-container" class="result-container">
-            <div class="success" id="success-message"></div>
-            
-            <div class="info-card">
-                <h3>Feed Information</h3>
-                <p id="feed-version">Version: </p>
-                <p id="feed-timestamp">Timestamp: </p>
-                <p id="entity-count">Entities: </p>
-                
-                <h4>Entity Types</h4>
-                <p id="alert-count">Alerts: </p>
-                <p id="trip-count">Trip Updates: </p>
-                <p id="vehicle-count">Vehicle Positions: </p>
-            </div>
-            
-            <div class="button-group">
-                <button id="downloadCsvButton">Download CSV</button>
-                <button id="downloadJsonButton">Download JSON</button>
-            </div>
-        </div>
-    </div>
+    # Process stop time updates; read the fields directly (an unset time
+    # reads as 0) instead of three HasField calls per stop
+    stop_updates = "; ".join(
+        f"{s.stop_id}:{s.arrival.time or ''}-{s.departure.time or ''}"
+        for s in trip_update.stop_time_update)
     
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {
-            const dropArea = document.getElementById('drop-area');
-            const fileInput = document.getElementById('fileInput');
-            const browseButton = document.getElementById('browseButton');
-            const parseButton = document.getElementById('parseButton');
-            const downloadCsvButton = document.getElementById('downloadCsvButton');
-            const downloadJsonButton = document.getElementById('downloadJsonButton');
-            const fileNameDisplay = document.getElementById('file-name');
-            const loadingIndicator = document.getElementById('loading');
-            const errorContainer = document.getElementById('error-container');
-            const resultContainer = document.getElementById('result-container');
-            const successMessage = document.getElementById('success-message');
-            const feedVersion = document.getElementById('feed-version');
-            const feedTimestamp = document.getElementById('feed-timestamp');
-            const entityCount = document.getElementById('entity-count');
-            const alertCount = document.getElementById('alert-count');
-            const tripCount = document.getElementById('trip-count');
-            const vehicleCount = document.getElementById('vehicle-count');
-            
-            // Store the file name without extension for download
-            let baseFileName = '';
-            
-            // Drag and drop functionality
-            ['dragenter', 'dragover', 'dragleave', 'drop'].forEach(eventName => {
-                dropArea.addEventListener(eventName, preventDefaults, false);
-            });
-
-            function preventDefaults(e) {
-                e.preventDefault();
-                e.stopPropagation();
-            }
-
-            ['dragenter', 'dragover'].forEach(eventName => {
-                dropArea.addEventListener(eventName, highlight, false);
-            });
-
-            ['dragleave', 'drop'].forEach(eventName => {
-                dropArea.addEventListener(eventName, unhighlight, false);
-            });
+    cols["Entity ID"].append(entity.id)
+    cols["Trip ID"].append(trip_id)
+    cols["Route ID"].append(route_id)
+    cols["Schedule Relationship"].append(schedule_relationship)
+    cols["Stop Updates"].append(stop_updates)
+    cols["Timestamp"].append(
+        trip_update.timestamp if trip_update.HasField("timestamp") else "")
 
-            function highlight() {
-                dropArea.classList.add('active');
-            }
-
-            function unhighlight() {
-                dropArea.classList.remove('active');
-            }
-
-            dropArea.addEventListener('drop', handleDrop, false);
+def process_vehicle_position(entity, cols):
+    """Process a vehicle position entity into the vehicle columns."""
+    vehicle = entity.vehicle
+    trip = vehicle.trip
+    descriptor = vehicle.vehicle
 
-            function handleDrop(e) {
-                const dt = e.dataTransfer;
-                const files = dt.files;
-                if (files.length) {
-                    handleFiles(files);
-                }
-            }
+    # Basic trip and vehicle info (unset scalar strings are already "")
+    trip_id = trip.trip_id
+    route_id = trip.route_id
+    vehicle_id = descriptor.id
+    vehicle_label = descriptor.label
 
-            function handleFiles(files) {
-                const file = files[0];
-                if (file && file.name.endsWith('.pb')) {
-                    fileNameDisplay.textContent = `Selected file: ${file.name}`;
-                    parseButton.disabled = false;
-                    fileInput.files = files;
-                    
-                    // Store base file name for download
-                    baseFileName = file.name.replace('.pb', '');
-                } else {
-                    fileNameDisplay.textContent = 'Please select a valid .pb file';
-                    parseButton.disabled = true;
-                }
-            }
+    # Position info; presence checks stay only where unset differs from a
+    # legitimate zero (bearing/speed)
+    pos = vehicle.position
+    has_pos = vehicle.HasField("position")
+    latitude = pos.latitude if has_pos else ""
+    longitude = pos.longitude if has_pos else ""
+    bearing = pos.bearing if has_pos and pos.HasField("bearing") else ""
+    speed = pos.speed if has_pos and pos.HasField("speed") else ""
 
-            browseButton.addEventListener('click', () => {
-                fileInput.click();
-            });
-
-            fileInput.addEventListener('change', (e) => {
-                if (fileInput.files.length) {
-                    handleFiles(fileInput.files);
-                }
-            });
-
-            // Parse GTFS Data
-            parseButton.addEventListener('click', async () => {
-                if (!fileInput.files.length) return;
-                
-                const file = fileInput.files[0];
-                errorContainer.style.display = 'none';
-                loadingIndicator.style.display = 'flex';
-                resultContainer.style.display = 'none';
-                
-                try {
-                    const formData = new FormData();
-                    formData.append('file', file);
-                    
-                    const response = await fetch('/upload', {
-                        method: 'POST',
-                        body: formData
-                    });
-                    
-                    const data = await response.json();
-                    
-                    if (response.ok) {
-                        // Update UI with the result
-                        successMessage.textContent = data.message;
-                        feedVersion.textContent = `Version: ${data.feed_info.version}`;
-                        feedTimestamp.textContent = `Timestamp: ${data.feed_info.timestamp ? new Date(data.feed_info.timestamp).toLocaleString() : 'Not available'}`;
-                        entityCount.textContent = `Entities: ${data.feed_info.entity_count}`;
-                        
-                        alertCount.textContent = `Alerts: ${data.entity_counts.alerts}`;
-                        tripCount.textContent = `Trip Updates: ${data.entity_counts.trip_updates}`;
-                        vehicleCount.textContent = `Vehicle Positions: ${data.entity_counts.vehicle_positions}`;
-                        
-                        // Show the result container
-                        resultContainer.style.display = 'block';
-                    } else {
-                        throw new Error(data.error || 'Error parsing GTFS data');
-                    }
-                } catch (error) {
-                    console.error('Error:', error);
-                    errorContainer.textContent = error.message;
-                    errorContainer.style.display = 'block';
-                } finally {
-                    loadingIndicator.style.display = 'none';
-                }
-            });
-            
-            // Download buttons
-            downloadCsvButton.addEventListener('click', () => {
-                window.location.href = `/download/csv?filename=${encodeURIComponent(baseFileName)}`;
-            });
-            
-            downloadJsonButton.addEventListener('click', () => {
-                window.location.href = `/download/json?filename=${encodeURIComponent(baseFileName)}`;
-            });
-        });
-    </script>
-</body>
-</html>''')
+    # Current stop info
+    current_stop = vehicle.stop_id
+    current_status = (_VEH_STATUS_NAMES.get(vehicle.current_status, "")
+                      if vehicle.HasField("current_status") else "")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    cols["Entity ID"].append(entity.id)
+    cols["Trip ID"].append(trip_id)
+    cols["Route ID"].append(route_id)
+    cols["Vehicle ID"].append(vehicle_id)
+    cols["Vehicle Label"].append(vehicle_label)
+    cols["Latitude"].append(latitude)
+    cols["Longitude"].append(longitude)
+    cols["Bearing"].append(bearing)
+    cols["Speed"].append(speed)
+    cols["Current Stop"].append(current_stop)
+    cols["Current Status"].append(current_status)
+    cols["Timestamp"].append(
+        vehicle.timestamp if vehicle.HasField("timestamp") else "")
+
+if __name__ == '__main__':
+    # Development server only. In production run under a preforking WSGI
+    # server; the protobuf native backend releases the GIL during parsing,
+    # so threaded workers scale for the parse step:
+    #   gunicorn -w $(nproc) -k gthread --threads 2 -b 0.0.0.0:5000 webapp.app:app
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000)